@@ -8,11 +8,12 @@ It provides a simple CLI for starting the API server and other operations.
 import argparse
 import logging
 import sys
-
-import uvicorn
+from collections.abc import Callable
+from importlib.util import find_spec
 
 from challenge import __version__
-from challenge.api.main import app
+
+logger = logging.getLogger(__name__)
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -30,6 +31,31 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
+def _server_backends() -> tuple[str, str]:
+    """
+    Select the uvicorn event loop and HTTP parser implementations.
+
+    Prefers uvloop and httptools (installed by ``uvicorn[standard]``) and warns
+    when falling back to the pure-Python implementations instead of letting
+    uvicorn downgrade silently.
+
+    Returns:
+        Tuple of (loop, http) values for ``uvicorn.run``
+
+    """
+    loop = "uvloop" if find_spec("uvloop") is not None else "asyncio"
+    http = "httptools" if find_spec("httptools") is not None else "h11"
+
+    if (loop, http) != ("uvloop", "httptools"):
+        logger.warning(
+            "uvloop/httptools not available, falling back to %s/%s (install uvicorn[standard])",
+            loop,
+            http,
+        )
+
+    return loop, http
+
+
 def run_api(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> None:  # noqa: S104
     """
     Start the FastAPI application server.
@@ -40,27 +66,95 @@ def run_api(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> No
         reload: Enable auto-reload on code changes (development mode)
 
     """
-    logging.info("Starting skeleton-challenge API v%s", __version__)
-    logging.info("Server: http://%s:%d", host, port)
-    logging.info("API Documentation: http://%s:%d/api/docs", host, port)
+    # Imported lazily so that argparse-only paths (--help, --version) don't pay
+    # for loading uvicorn, FastAPI and Pydantic.
+    import uvicorn  # noqa: PLC0415
+
+    from challenge.api.main import app  # noqa: PLC0415
+
+    loop, http = _server_backends()
+
+    logger.info("Starting skeleton-challenge API v%s", __version__)
+    logger.info("Server: http://%s:%d", host, port)
+    logger.info("API Documentation: http://%s:%d/api/docs", host, port)
 
     uvicorn.run(
         app,
         host=host,
         port=port,
         reload=reload,
+        loop=loop,
+        http=http,
         log_level="info",
     )
 
 
-def main() -> int:
+def _add_api_parser(subparsers: argparse._SubParsersAction) -> None:
+    """
+    Register the ``api`` subcommand.
+
+    Args:
+        subparsers: Subparsers action of the top-level parser
+
+    """
+    api_parser = subparsers.add_parser("api", help="Start the API server")
+    api_parser.add_argument(
+        "--host",
+        default="0.0.0.0",  # noqa: S104
+        help="Server host address (default: 0.0.0.0)",
+    )
+    api_parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Server port number (default: 8000)",
+    )
+    api_parser.add_argument(
+        "--reload",
+        action="store_true",
+        help="Enable auto-reload on code changes (development mode)",
+    )
+
+
+_SUBCOMMANDS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "api": _add_api_parser,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """
+    Find the requested subcommand without building the full parser.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        First positional argument, or None if no subcommand was given
+
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == "--log-level":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
     """
     Run the main CLI entry point.
 
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+
     Returns:
         Exit code (0 for success, non-zero for failure)
 
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         description=f"Skeleton Challenge v{__version__} - Clean Architecture Python Project",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -81,26 +175,16 @@ def main() -> int:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # API server command
-    api_parser = subparsers.add_parser("api", help="Start the API server")
-    api_parser.add_argument(
-        "--host",
-        default="0.0.0.0",  # noqa: S104
-        help="Server host address (default: 0.0.0.0)",
-    )
-    api_parser.add_argument(
-        "--port",
-        type=int,
-        default=8000,
-        help="Server port number (default: 8000)",
-    )
-    api_parser.add_argument(
-        "--reload",
-        action="store_true",
-        help="Enable auto-reload on code changes (development mode)",
-    )
+    # Only build the parser for the requested subcommand; --help, a missing
+    # command or an unknown one fall back to registering all of them.
+    command = _sniff_subcommand(argv)
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_subparser in _SUBCOMMANDS.values():
+            add_subparser(subparsers)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Setup logging
     setup_logging(args.log_level)
@@ -112,9 +196,9 @@ def main() -> int:
 
     # If no command provided, show help and default to API server
     if not args.command:
-        print(f"skeleton-challenge v{__version__}")
-        print("\nNo command specified. Starting API server...")
-        print("Use --help to see available commands\n")
+        logger.info("skeleton-challenge v%s", __version__)
+        logger.info("No command specified. Starting API server...")
+        logger.info("Use --help to see available commands")
         run_api()
         return 0
 
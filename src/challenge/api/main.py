@@ -10,21 +10,27 @@ This module provides the FastAPI application factory pattern, enabling:
 """
 
 import logging
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
 from challenge import __version__
+from challenge.api.middleware import RequestLoggingMiddleware, SelectiveGZipMiddleware
 from challenge.api.routes import health
 
 logger = logging.getLogger(__name__)
 
+API_PREFIX = "/api/v1"
+
+# Health probes: tiny, high-frequency responses that skip gzip and request logging.
+# Matched on segment boundaries, so sibling routes such as /healthz are not excluded.
+HEALTH_PATH_PREFIX = f"{API_PREFIX}/health"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -73,6 +79,9 @@ def create_app(environment: str = "development") -> FastAPI:
         openapi_url="/api/openapi.json" if environment != "production" else None,
     )
 
+    # Single source of truth for the environment (reported by /health)
+    app.state.environment = environment
+
     # Configure CORS
     _configure_cors(app, environment)
 
@@ -124,29 +133,15 @@ def _configure_middleware(app: FastAPI) -> None:
         app: FastAPI application instance
 
     """
-    # GZip compression for responses
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-
-    # Request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        """Log all incoming requests and responses."""
-        logger.info(
-            "Incoming request: %s %s",
-            request.method,
-            request.url.path,
-        )
-
-        response = await call_next(request)
-
-        logger.info(
-            "Response: %s %s - Status: %d",
-            request.method,
-            request.url.path,
-            response.status_code,
-        )
+    # GZip compression for responses (health probes are never large enough)
+    app.add_middleware(
+        SelectiveGZipMiddleware,
+        minimum_size=1000,
+        exclude_prefixes=(HEALTH_PATH_PREFIX,),
+    )
 
-        return response
+    # Request logging middleware (probe traffic would only add noise)
+    app.add_middleware(RequestLoggingMiddleware, exclude_prefixes=(HEALTH_PATH_PREFIX,))
 
 
 def _register_error_handlers(app: FastAPI) -> None:
@@ -213,7 +208,7 @@ def _register_routes(app: FastAPI) -> None:
 
     """
     # Include API routers
-    app.include_router(health.router, prefix="/api/v1", tags=["health"])
+    app.include_router(health.router, prefix=API_PREFIX, tags=["health"])
 
 
 # Create default application instance for uvicorn
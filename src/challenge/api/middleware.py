@@ -0,0 +1,93 @@
+"""
+ASGI middleware for the API.
+
+Middleware here is written against the raw ASGI interface instead of
+Starlette's BaseHTTPMiddleware, so it adds no extra task or stream
+plumbing to each request.
+"""
+
+import logging
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class _PathPrefixes:
+    """
+    Segment-aware path prefix matcher.
+
+    A prefix matches itself and any path below it, so ``/health`` matches
+    ``/health`` and ``/health/live`` but not siblings like ``/healthz``.
+    """
+
+    __slots__ = ("exact", "subtree")
+
+    def __init__(self, prefixes: tuple[str, ...]) -> None:
+        self.exact = frozenset(prefixes)
+        self.subtree = tuple(f"{prefix.rstrip('/')}/" for prefix in prefixes)
+
+    def match(self, path: str) -> bool:
+        """Return True if ``path`` equals a prefix or lies beneath one."""
+        return path in self.exact or path.startswith(self.subtree)
+
+
+class SelectiveGZipMiddleware:
+    """
+    GZip compression that bypasses excluded path prefixes.
+
+    Prefixes are matched on path-segment boundaries (see ``_PathPrefixes``).
+
+    Health probe responses are far below the compression threshold, so
+    routing them around GZipMiddleware avoids wrapping ``send`` for every probe.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        exclude_prefixes: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, minimum_size=minimum_size)
+        self.exclude_prefixes = _PathPrefixes(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Dispatch excluded paths straight to the app and the rest through GZip."""
+        if scope["type"] == "http" and self.exclude_prefixes.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        await self.gzip_app(scope, receive, send)
+
+
+class RequestLoggingMiddleware:
+    """
+    Log every HTTP request and the status code of its response.
+
+    Requests at or under excluded path prefixes (e.g. orchestrator health
+    probes polled every few seconds) are passed through without logging.
+    Prefixes are matched on path-segment boundaries (see ``_PathPrefixes``).
+    """
+
+    def __init__(self, app: ASGIApp, exclude_prefixes: tuple[str, ...] = ()) -> None:
+        self.app = app
+        self.exclude_prefixes = _PathPrefixes(exclude_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log the request, then its response status once the response starts."""
+        if scope["type"] != "http" or self.exclude_prefixes.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        logger.info("Incoming request: %s %s", method, path)
+
+        async def send_with_logging(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                logger.info("Response: %s %s - Status: %d", method, path, message["status"])
+            await send(message)
+
+        await self.app(scope, receive, send_with_logging)
@@ -18,10 +18,11 @@ These endpoints are used by:
 import logging
 import platform
 import sys
+import time
 from datetime import datetime, timezone
 from typing import Any
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 from pydantic import BaseModel, Field
 
 from challenge import __version__
@@ -30,6 +31,51 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_UTC = timezone.utc
+
+# Probe timestamps only need coarse resolution, so the clock is read at most
+# once per window and the same datetime is shared by requests within it.
+_TIMESTAMP_RESOLUTION = 0.5  # seconds
+_cached_now = datetime.now(_UTC)
+_cached_at = time.monotonic()
+
+
+def _utcnow() -> datetime:
+    """
+    Return the current server time as a timezone-aware UTC datetime.
+
+    The value is refreshed at most every ``_TIMESTAMP_RESOLUTION`` seconds.
+    """
+    global _cached_now, _cached_at
+    now = time.monotonic()
+    if now - _cached_at >= _TIMESTAMP_RESOLUTION:
+        _cached_now = datetime.now(_UTC)
+        _cached_at = now
+    return _cached_now
+
+
+# Process-wide constants, computed once at import instead of on every probe
+_SYSTEM_INFO: dict[str, Any] = {
+    "python_version": sys.version,
+    "platform": platform.platform(),
+    "architecture": platform.machine(),
+}
+
+# Static component checks. As components are integrated, merge live results
+# per request, e.g. {**_HEALTH_CHECKS, "database": await check_database()}.
+_HEALTH_CHECKS: dict[str, str] = {
+    "application": "healthy",
+}
+
+_READINESS_CHECKS: dict[str, bool] = {
+    "application": True,
+}
+
+# Readiness only depends on static checks for now. Once dependency checks are
+# added, run them concurrently (asyncio.gather) and cache the result for a
+# short TTL rather than awaiting each one sequentially on every probe.
+_READY = all(_READINESS_CHECKS.values())
+
 
 class HealthResponse(BaseModel):
     """Health check response model."""
@@ -108,7 +154,7 @@ class ReadinessResponse(BaseModel):
     description="Returns detailed health information including version, system details, and component checks",
     tags=["health"],
 )
-async def health_check() -> DetailedHealthResponse:
+async def health_check(request: Request) -> DetailedHealthResponse:
     """
     Comprehensive health check endpoint.
 
@@ -118,28 +164,20 @@ async def health_check() -> DetailedHealthResponse:
     - Component health checks
     - Server timestamp
 
-    Used for monitoring and diagnostics.
+    Used for monitoring and diagnostics. The reported environment is the
+    one the app was created with (``create_app(environment=...)``).
+
+    Responses are built with ``model_construct`` because every value is
+    produced by the server itself; FastAPI still checks the returned model
+    against ``response_model`` before serializing it.
     """
-    # Perform component checks
-    checks = {
-        "application": "healthy",
-        # Add more checks as components are integrated:
-        # "database": await check_database(),
-        # "cache": await check_cache(),
-        # "external_api": await check_external_api(),
-    }
-
-    return DetailedHealthResponse(
+    return DetailedHealthResponse.model_construct(
         status="healthy",
         version=__version__,
-        timestamp=datetime.now(timezone.utc),
-        environment="development",  # TODO: Get from environment variable
-        system={
-            "python_version": sys.version,
-            "platform": platform.platform(),
-            "architecture": platform.machine(),
-        },
-        checks=checks,
+        timestamp=_utcnow(),
+        environment=request.app.state.environment,
+        system=_SYSTEM_INFO,
+        checks=_HEALTH_CHECKS,
     )
 
 
@@ -162,11 +200,9 @@ async def liveness_check() -> LivenessResponse:
     This endpoint should always return 200 OK if the application can
     process requests, even if dependencies are unavailable.
     """
-    logger.debug("Liveness check performed")
-
-    return LivenessResponse(
+    return LivenessResponse.model_construct(
         alive=True,
-        timestamp=datetime.now(timezone.utc),
+        timestamp=_utcnow(),
     )
 
 
@@ -196,22 +232,11 @@ async def readiness_check() -> ReadinessResponse:
     - Cache connection available
     - External API dependencies reachable
     """
-    # Perform readiness checks
-    checks = {
-        "application": True,
-        # Add more checks as components are integrated:
-        # "database": await is_database_ready(),
-        # "cache": await is_cache_ready(),
-        # "external_api": await is_external_api_ready(),
-    }
-
-    ready = all(checks.values())
-
-    if not ready:
-        logger.warning("Readiness check failed: %s", checks)
-
-    return ReadinessResponse(
-        ready=ready,
-        checks=checks,
-        timestamp=datetime.now(timezone.utc),
+    if not _READY:
+        logger.warning("Readiness check failed: %s", _READINESS_CHECKS)
+
+    return ReadinessResponse.model_construct(
+        ready=_READY,
+        checks=_READINESS_CHECKS,
+        timestamp=_utcnow(),
     )
@@ -4,11 +4,12 @@ Shared pytest fixtures and configuration for all tests.
 
 import asyncio
 import os
+import re
 import sys
 import time
-import uuid
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -87,13 +88,37 @@ async def async_client():
         yield client
 
 
-@pytest.fixture
-def test_client():
-    """Create a FastAPI test client for API endpoint testing."""
+@pytest.fixture(scope="session")
+def test_app():
+    """Create the FastAPI application once for the whole test session."""
     from challenge.api.main import create_app  # noqa: PLC0415
 
-    app = create_app(environment="test")
-    with TestClient(app) as client:
+    return create_app(environment="test")
+
+
+@pytest.fixture(scope="session")
+def test_client(test_app):
+    """
+    Create a FastAPI test client shared by all API endpoint tests.
+
+    The client is session-scoped, so tests must not depend on client state
+    (cookies, default headers) left by other tests. Tests that need an
+    isolated client should open their own ``TestClient(test_app)``.
+    """
+    with TestClient(test_app) as client:
+        yield client
+
+
+@pytest.fixture
+async def asgi_client(test_app):
+    """
+    Create an async client that calls the test app in-process over ASGI.
+
+    Unlike ``test_client``, requests can be awaited concurrently (e.g. with
+    ``asyncio.gather``). The app's lifespan is not run.
+    """
+    transport = httpx.ASGITransport(app=test_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
@@ -102,29 +127,68 @@ def test_client():
 # ============================================================================
 
 
-@pytest.fixture
-def sample_config():
-    """Sample configuration for testing."""
-    return {
+_SAMPLE_CONFIG = MappingProxyType(
+    {
         "log_level": "DEBUG",
         "environment": "test",
         "cache_enabled": False,
         "api_key": "test-api-key",
     }
+)
 
-
-@pytest.fixture
-def sample_entity_data():
-    """Sample entity data for domain tests."""
-    return {
+_SAMPLE_ENTITY_DATA = MappingProxyType(
+    {
         "id": "test-123",
         "name": "Test Entity",
         "created_at": "2024-01-01T00:00:00Z",
-        "metadata": {
-            "version": "1.0.0",
-            "author": "test",
-        },
+        "metadata": MappingProxyType(
+            {
+                "version": "1.0.0",
+                "author": "test",
+            }
+        ),
     }
+)
+
+
+def _thaw(mapping):
+    """Return a deep plain-dict copy of a (possibly nested) read-only mapping."""
+    return {key: _thaw(value) if isinstance(value, MappingProxyType) else value for key, value in mapping.items()}
+
+
+@pytest.fixture(scope="session")
+def sample_config():
+    """
+    Sample configuration for testing.
+
+    Read-only ``MappingProxyType``, which is not JSON-serializable; use
+    ``mutable_sample_config`` to modify it or pass it to ``json=``.
+    """
+    return _SAMPLE_CONFIG
+
+
+@pytest.fixture
+def mutable_sample_config():
+    """Fresh, mutable plain-dict copy of the sample configuration."""
+    return _thaw(_SAMPLE_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def sample_entity_data():
+    """
+    Sample entity data for domain tests.
+
+    Read-only ``MappingProxyType`` (including ``metadata``), which is not
+    JSON-serializable; use ``mutable_sample_entity_data`` for request
+    bodies or ``json.dumps``.
+    """
+    return _SAMPLE_ENTITY_DATA
+
+
+@pytest.fixture
+def mutable_sample_entity_data():
+    """Fresh, mutable deep plain-dict copy of the sample entity data."""
+    return _thaw(_SAMPLE_ENTITY_DATA)
 
 
 # ============================================================================
@@ -135,19 +199,32 @@ def sample_entity_data():
 class AssertionHelpers:
     """Reusable assertion helpers for tests."""
 
+    _UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+    _ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+    _ISO_SHAPE_RE = re.compile(r"\A\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z?\Z")
+
     @staticmethod
     def assert_valid_uuid(value: str) -> None:
-        """Assert that a value is a valid UUID."""
-        try:
-            uuid.UUID(value)
-        except ValueError:
+        """Assert that a value is a valid hyphenated UUID."""
+        if not AssertionHelpers._UUID_RE.match(value):
             pytest.fail(f"'{value}' is not a valid UUID")
 
     @staticmethod
-    def assert_datetime_format(value: str, fmt: str = "%Y-%m-%dT%H:%M:%S") -> None:
-        """Assert that a value matches a datetime format."""
+    def assert_datetime_format(value: str, fmt: str = _ISO_FORMAT) -> None:
+        """
+        Assert that a value matches a datetime format.
+
+        For the default format the exact shape (optionally ``Z``-suffixed)
+        is checked with a precompiled regex and the field values with
+        ``datetime.fromisoformat``; any other ``fmt`` falls back to ``strptime``.
+        """
         try:
-            datetime.strptime(value.replace("Z", ""), fmt)
+            if fmt == AssertionHelpers._ISO_FORMAT:
+                if not AssertionHelpers._ISO_SHAPE_RE.match(value):
+                    raise ValueError(value)
+                datetime.fromisoformat(value.removesuffix("Z"))
+            else:
+                datetime.strptime(value.replace("Z", ""), fmt)
         except ValueError:
             pytest.fail(f"'{value}' does not match format '{fmt}'")
 
@@ -157,10 +234,13 @@ class AssertionHelpers:
         assert min_val <= value <= max_val, f"{value} is not between {min_val} and {max_val}"
 
 
-@pytest.fixture
+_ASSERT_HELPERS = AssertionHelpers()
+
+
+@pytest.fixture(scope="session")
 def assert_helpers():
-    """Provide assertion helpers to tests."""
-    return AssertionHelpers()
+    """Provide assertion helpers to tests (stateless, so shared across the session)."""
+    return _ASSERT_HELPERS
 
 
 # ============================================================================
@@ -173,29 +253,19 @@ def benchmark_timer():
     """Simple benchmark timer for performance tests."""
 
     class Timer:
+        """Context manager measuring wall time; ``elapsed`` is in seconds."""
+
+        __slots__ = ("elapsed", "start_time")
+
         def __init__(self):
             self.start_time = None
             self.elapsed = None
 
         def __enter__(self):
-            self.start_time = time.perf_counter()
+            self.start_time = time.perf_counter_ns()
             return self
 
         def __exit__(self, *args):
-            self.elapsed = time.perf_counter() - self.start_time
+            self.elapsed = (time.perf_counter_ns() - self.start_time) / 1e9
 
     return Timer
-
-
-# ============================================================================
-# Markers and Hooks
-# ============================================================================
-
-
-def pytest_configure(config):
-    """Configure pytest with custom markers."""
-    config.addinivalue_line("markers", "unit: Unit tests (no external dependencies)")
-    config.addinivalue_line("markers", "integration: Integration tests (may require external services)")
-    config.addinivalue_line("markers", "contract: Contract tests (behavioral requirements)")
-    config.addinivalue_line("markers", "slow: Slow tests (>1 second)")
-    config.addinivalue_line("markers", "smoke: Smoke tests (basic sanity checks)")
@@ -3,76 +3,85 @@ Tests for health check endpoints.
 
 Tests verify:
 - Basic health check returns correct structure
+- /health reports the environment the app was created with
+- Timestamps are cached for _TIMESTAMP_RESOLUTION and stay timezone-aware
 - Liveness probe always returns 200 OK
 - Readiness probe checks component status
 - Response models match expected schema
 - Proper status codes and headers
 """
 
+import asyncio
 from datetime import datetime
 
+import orjson
 import pytest
 from fastapi import status
+from fastapi.testclient import TestClient
 
 from challenge import __version__
+from challenge.api.main import create_app
+from challenge.api.routes import health
 
+_OK = status.HTTP_200_OK
 
-@pytest.mark.unit
-def test_health_endpoint_returns_200(test_client):
-    """Test that /health endpoint returns 200 OK."""
-    response = test_client.get("/api/v1/health")
+HEALTH_ENDPOINTS = (
+    "/api/v1/health",
+    "/api/v1/health/live",
+    "/api/v1/health/ready",
+)
 
-    assert response.status_code == status.HTTP_200_OK
+HEALTH_REQUIRED_KEYS = frozenset({"status", "version", "timestamp", "system", "checks"})
+LIVENESS_REQUIRED_KEYS = frozenset({"alive", "timestamp"})
+READINESS_REQUIRED_KEYS = frozenset({"ready", "checks", "timestamp"})
 
 
-@pytest.mark.unit
-def test_health_endpoint_response_structure(test_client):
-    """Test that /health endpoint returns expected response structure."""
-    response = test_client.get("/api/v1/health")
-    data = response.json()
+def _get_json(client, url: str):
+    """GET ``url`` and return the response with its body parsed by orjson."""
+    response = client.get(url)
+    return response, orjson.loads(response.content)
 
-    # Verify required fields are present
-    assert "status" in data
-    assert "version" in data
-    assert "timestamp" in data
-    assert "system" in data
-    assert "checks" in data
 
+@pytest.fixture(scope="module")
+def health_response(test_client):
+    """Fetch /health once and share the response and parsed body across tests."""
+    return _get_json(test_client, "/api/v1/health")
 
-@pytest.mark.unit
-def test_health_endpoint_contains_version(test_client):
-    """Test that /health endpoint contains correct version."""
-    response = test_client.get("/api/v1/health")
-    data = response.json()
 
-    assert data["version"] == __version__
+@pytest.fixture(scope="module")
+def liveness_response(test_client):
+    """Fetch /health/live once and share the response and parsed body across tests."""
+    return _get_json(test_client, "/api/v1/health/live")
+
+
+@pytest.fixture(scope="module")
+def readiness_response(test_client):
+    """Fetch /health/ready once and share the response and parsed body across tests."""
+    return _get_json(test_client, "/api/v1/health/ready")
 
 
 @pytest.mark.unit
-def test_health_endpoint_status_is_healthy(test_client):
-    """Test that /health endpoint status is 'healthy'."""
-    response = test_client.get("/api/v1/health")
-    data = response.json()
+def test_health_endpoint_returns_200(health_response):
+    """Test that /health endpoint returns 200 OK."""
+    response, _ = health_response
 
-    assert data["status"] == "healthy"
+    assert response.status_code == _OK
 
 
 @pytest.mark.unit
-def test_health_endpoint_timestamp_is_valid(test_client):
-    """Test that /health endpoint timestamp is valid ISO format."""
-    response = test_client.get("/api/v1/health")
-    data = response.json()
+def test_health_response_contract(health_response):
+    """Test that /health returns every required field with healthy status and current version."""
+    _, data = health_response
 
-    # Verify timestamp can be parsed as datetime
-    timestamp = data["timestamp"]
-    datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    assert HEALTH_REQUIRED_KEYS <= set(data)
+    assert data["status"] == "healthy"
+    assert data["version"] == __version__
 
 
 @pytest.mark.unit
-def test_health_endpoint_includes_system_info(test_client):
+def test_health_endpoint_includes_system_info(health_response):
     """Test that /health endpoint includes system information."""
-    response = test_client.get("/api/v1/health")
-    data = response.json()
+    _, data = health_response
 
     system = data["system"]
     assert "python_version" in system
@@ -81,10 +90,9 @@ def test_health_endpoint_includes_system_info(test_client):
 
 
 @pytest.mark.unit
-def test_health_endpoint_includes_component_checks(test_client):
+def test_health_endpoint_includes_component_checks(health_response):
     """Test that /health endpoint includes component health checks."""
-    response = test_client.get("/api/v1/health")
-    data = response.json()
+    _, data = health_response
 
     checks = data["checks"]
     assert isinstance(checks, dict)
@@ -93,67 +101,62 @@ def test_health_endpoint_includes_component_checks(test_client):
 
 
 @pytest.mark.unit
-def test_liveness_endpoint_returns_200(test_client):
-    """Test that /health/live endpoint returns 200 OK."""
-    response = test_client.get("/api/v1/health/live")
+def test_health_endpoint_reports_app_environment(health_response):
+    """Test that /health reports the environment the test app was created with."""
+    _, data = health_response
 
-    assert response.status_code == status.HTTP_200_OK
+    assert data["environment"] == "test"
 
 
 @pytest.mark.unit
-def test_liveness_endpoint_response_structure(test_client):
-    """Test that /health/live endpoint returns expected response structure."""
-    response = test_client.get("/api/v1/health/live")
-    data = response.json()
+def test_health_endpoint_environment_follows_create_app(monkeypatch):
+    """Test that /health reports create_app's environment, not the ENVIRONMENT variable."""
+    monkeypatch.setenv("ENVIRONMENT", "production")
+
+    with TestClient(create_app(environment="staging")) as client:
+        data = client.get("/api/v1/health").json()
 
-    assert "alive" in data
-    assert "timestamp" in data
+    assert data["environment"] == "staging"
 
 
 @pytest.mark.unit
-def test_liveness_endpoint_always_alive(test_client):
-    """Test that /health/live endpoint always returns alive=True."""
-    response = test_client.get("/api/v1/health/live")
-    data = response.json()
+def test_liveness_endpoint_returns_200(liveness_response):
+    """Test that /health/live endpoint returns 200 OK."""
+    response, _ = liveness_response
 
-    assert data["alive"] is True
+    assert response.status_code == _OK
 
 
 @pytest.mark.unit
-def test_liveness_endpoint_timestamp_is_valid(test_client):
-    """Test that /health/live endpoint timestamp is valid ISO format."""
-    response = test_client.get("/api/v1/health/live")
-    data = response.json()
+def test_liveness_response_contract(liveness_response):
+    """Test that /health/live returns every required field and always reports alive=True."""
+    _, data = liveness_response
 
-    # Verify timestamp can be parsed as datetime
-    timestamp = data["timestamp"]
-    datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    assert LIVENESS_REQUIRED_KEYS <= set(data)
+    assert data["alive"] is True
 
 
 @pytest.mark.unit
-def test_readiness_endpoint_returns_200(test_client):
+def test_readiness_endpoint_returns_200(readiness_response):
     """Test that /health/ready endpoint returns 200 OK."""
-    response = test_client.get("/api/v1/health/ready")
+    response, _ = readiness_response
 
-    assert response.status_code == status.HTTP_200_OK
+    assert response.status_code == _OK
 
 
 @pytest.mark.unit
-def test_readiness_endpoint_response_structure(test_client):
-    """Test that /health/ready endpoint returns expected response structure."""
-    response = test_client.get("/api/v1/health/ready")
-    data = response.json()
+def test_readiness_response_contract(readiness_response):
+    """Test that /health/ready returns every required field and reports ready=True."""
+    _, data = readiness_response
 
-    assert "ready" in data
-    assert "checks" in data
-    assert "timestamp" in data
+    assert READINESS_REQUIRED_KEYS <= set(data)
+    assert data["ready"] is True
 
 
 @pytest.mark.unit
-def test_readiness_endpoint_includes_checks(test_client):
+def test_readiness_endpoint_includes_checks(readiness_response):
     """Test that /health/ready endpoint includes readiness checks."""
-    response = test_client.get("/api/v1/health/ready")
-    data = response.json()
+    _, data = readiness_response
 
     checks = data["checks"]
     assert isinstance(checks, dict)
@@ -162,61 +165,65 @@ def test_readiness_endpoint_includes_checks(test_client):
 
 
 @pytest.mark.unit
-def test_readiness_endpoint_ready_status(test_client):
-    """Test that /health/ready endpoint returns ready status."""
-    response = test_client.get("/api/v1/health/ready")
-    data = response.json()
+@pytest.mark.parametrize(
+    "response_fixture",
+    ["health_response", "liveness_response", "readiness_response"],
+    ids=["health", "live", "ready"],
+)
+def test_health_endpoint_timestamp_is_valid(request, response_fixture):
+    """Test that each health endpoint returns a timezone-aware ISO timestamp."""
+    _, data = request.getfixturevalue(response_fixture)
 
-    assert data["ready"] is True
+    assert datetime.fromisoformat(data["timestamp"]).tzinfo is not None
 
 
 @pytest.mark.unit
-def test_readiness_endpoint_timestamp_is_valid(test_client):
-    """Test that /health/ready endpoint timestamp is valid ISO format."""
-    response = test_client.get("/api/v1/health/ready")
-    data = response.json()
+def test_utcnow_is_cached_within_resolution_window(monkeypatch):
+    """Test that _utcnow reuses one datetime inside the window and refreshes after it."""
+    clock = [1000.0]
+    monkeypatch.setattr(health.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(health, "_cached_at", clock[0] - health._TIMESTAMP_RESOLUTION)
+    monkeypatch.setattr(health, "_cached_now", health._cached_now)  # restored after the test
+
+    first = health._utcnow()
+    clock[0] += health._TIMESTAMP_RESOLUTION / 2
+    assert health._utcnow() is first
 
-    # Verify timestamp can be parsed as datetime
-    timestamp = data["timestamp"]
-    datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    clock[0] += health._TIMESTAMP_RESOLUTION
+    refreshed = health._utcnow()
+
+    assert refreshed is not first
+    assert refreshed >= first
+    assert first.tzinfo is not None
+    assert refreshed.utcoffset().total_seconds() == 0
 
 
 @pytest.mark.unit
-def test_all_health_endpoints_return_json(test_client):
+async def test_all_health_endpoints_return_json(asgi_client):
     """Test that all health endpoints return JSON content type."""
-    endpoints = [
-        "/api/v1/health",
-        "/api/v1/health/live",
-        "/api/v1/health/ready",
-    ]
-
-    for endpoint in endpoints:
-        response = test_client.get(endpoint)
+    responses = await asyncio.gather(*(asgi_client.get(endpoint) for endpoint in HEALTH_ENDPOINTS))
+
+    for response in responses:
         assert "application/json" in response.headers["content-type"]
 
 
 @pytest.mark.unit
-def test_health_endpoints_are_fast(test_client, benchmark_timer):
-    """Test that health endpoints respond quickly (<100ms)."""
-    endpoints = [
-        "/api/v1/health",
-        "/api/v1/health/live",
-        "/api/v1/health/ready",
-    ]
+@pytest.mark.parametrize("endpoint", HEALTH_ENDPOINTS, ids=["health", "live", "ready"])
+def test_health_endpoints_are_fast(test_client, benchmark, endpoint):
+    """Test that health endpoints respond quickly (median <100ms)."""
+    if benchmark.disabled:
+        pytest.skip("benchmarks are disabled (--benchmark-disable or pytest-xdist); no stats to check")
 
-    for endpoint in endpoints:
-        with benchmark_timer() as timer:
-            test_client.get(endpoint)
+    benchmark.pedantic(test_client.get, args=(endpoint,), rounds=10, iterations=1)
 
-        # Health checks should be very fast (<100ms)
-        assert timer.elapsed < 0.1, f"{endpoint} took {timer.elapsed:.3f}s (>100ms)"
+    # Health checks should be very fast (<100ms)
+    assert benchmark.stats["median"] < 0.1, f"{endpoint} median {benchmark.stats['median']:.3f}s (>100ms)"
 
 
 @pytest.mark.smoke
-def test_health_check_smoke_test(test_client):
+def test_health_check_smoke_test(health_response):
     """Smoke test: basic health check works."""
-    response = test_client.get("/api/v1/health")
+    response, data = health_response
 
-    assert response.status_code == status.HTTP_200_OK
-    data = response.json()
+    assert response.status_code == _OK
     assert data["status"] == "healthy"
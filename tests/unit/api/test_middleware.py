@@ -0,0 +1,122 @@
+"""
+Tests for API middleware.
+
+Tests verify:
+- Excluded path prefixes bypass GZip compression
+- Other paths, including siblings of an excluded prefix, are still compressed
+- Requests and response status codes are logged
+- Excluded path prefixes are not logged, but sibling paths are
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from challenge.api.middleware import RequestLoggingMiddleware, SelectiveGZipMiddleware
+
+LARGE_BODY = "x" * 2000
+
+
+@pytest.fixture
+def gzip_client():
+    """Create a client for an app with compressible health and data routes."""
+    app = FastAPI()
+
+    @app.get("/health", response_class=PlainTextResponse)
+    async def health() -> str:
+        return LARGE_BODY
+
+    @app.get("/health/live", response_class=PlainTextResponse)
+    async def live() -> str:
+        return LARGE_BODY
+
+    @app.get("/healthz", response_class=PlainTextResponse)
+    async def healthz() -> str:
+        return LARGE_BODY
+
+    @app.get("/data", response_class=PlainTextResponse)
+    async def data() -> str:
+        return LARGE_BODY
+
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000, exclude_prefixes=("/health",))
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", ["/health", "/health/live"], ids=["prefix", "subpath"])
+def test_excluded_prefix_is_not_compressed(gzip_client, path):
+    """Test that responses at or under an excluded prefix skip GZip."""
+    response = gzip_client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_BODY
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("path", ["/data", "/healthz"], ids=["unrelated", "sibling"])
+def test_other_paths_are_compressed(gzip_client, path):
+    """Test that responses outside excluded prefixes, including sibling paths, are compressed."""
+    response = gzip_client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == LARGE_BODY
+
+
+@pytest.fixture
+def logging_client():
+    """Create a client for an app with request logging enabled."""
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items() -> list[str]:
+        return []
+
+    @app.get("/health")
+    async def health() -> dict[str, bool]:
+        return {"alive": True}
+
+    @app.get("/healthz")
+    async def healthz() -> dict[str, bool]:
+        return {"alive": True}
+
+    app.add_middleware(RequestLoggingMiddleware, exclude_prefixes=("/health",))
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.unit
+def test_request_and_response_are_logged(logging_client, caplog):
+    """Test that the request line and response status are logged."""
+    with caplog.at_level(logging.INFO, logger="challenge.api.middleware"):
+        logging_client.get("/items")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Incoming request: GET /items" in messages
+    assert "Response: GET /items - Status: 200" in messages
+
+
+@pytest.mark.unit
+def test_excluded_prefix_is_not_logged(logging_client, caplog):
+    """Test that requests under an excluded prefix produce no log records."""
+    with caplog.at_level(logging.INFO, logger="challenge.api.middleware"):
+        response = logging_client.get("/health")
+
+    assert response.status_code == 200
+    assert not caplog.records
+
+
+@pytest.mark.unit
+def test_sibling_of_excluded_prefix_is_logged(logging_client, caplog):
+    """Test that a path merely sharing an excluded prefix's text is still logged."""
+    with caplog.at_level(logging.INFO, logger="challenge.api.middleware"):
+        logging_client.get("/healthz")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert "Incoming request: GET /healthz" in messages
+    assert "Response: GET /healthz - Status: 200" in messages
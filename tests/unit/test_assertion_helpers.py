@@ -0,0 +1,93 @@
+"""
+Tests for the shared AssertionHelpers in conftest.
+
+Tests verify:
+- Hyphenated UUIDs are accepted and other spellings are rejected
+- The default datetime format is enforced exactly, not any ISO 8601 string
+- Custom formats are still checked with strptime
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    ["12345678-1234-1234-1234-1234567890ab", "12345678-1234-1234-1234-1234567890AB"],
+    ids=["lower", "upper"],
+)
+def test_assert_valid_uuid_accepts(assert_helpers, value):
+    """Test that hyphenated UUIDs in either case are accepted."""
+    assert_helpers.assert_valid_uuid(value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        "123456781234123412341234567890ab",
+        "{12345678-1234-1234-1234-1234567890ab}",
+        "urn:uuid:12345678-1234-1234-1234-1234567890ab",
+        "12345678-1234-1234-1234-1234567890a",
+        "12345678-1234-1234-1234-1234567890ag",
+        "12345678-1234-1234-1234-1234567890ab\n",
+        "not-a-uuid",
+    ],
+    ids=["no-hyphens", "braces", "urn", "too-short", "non-hex", "trailing-newline", "garbage"],
+)
+def test_assert_valid_uuid_rejects(assert_helpers, value):
+    """Test that non-hyphenated or malformed UUIDs are rejected."""
+    with pytest.raises(pytest.fail.Exception, match="is not a valid UUID"):
+        assert_helpers.assert_valid_uuid(value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    ["2024-01-01T00:00:00", "2024-01-01T23:59:59Z"],
+    ids=["naive", "z-suffix"],
+)
+def test_assert_datetime_format_accepts_default(assert_helpers, value):
+    """Test that the default format accepts YYYY-MM-DDTHH:MM:SS with optional Z."""
+    assert_helpers.assert_datetime_format(value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-01",
+        "2024-01-01 00:00",
+        "2024-01-01 00:00:00",
+        "2024-01-01T00:00",
+        "2024-01-01T00:00:00.5",
+        "2024-01-01T00:00:00+05:00",
+        "2024-01-01T00:00:00.5+05:00",
+        "2024-13-01T00:00:00",
+        "2024-01-01T24:00:00",
+    ],
+    ids=[
+        "date-only",
+        "space-no-seconds",
+        "space-separator",
+        "no-seconds",
+        "fraction",
+        "offset",
+        "fraction-offset",
+        "bad-month",
+        "bad-hour",
+    ],
+)
+def test_assert_datetime_format_rejects_default(assert_helpers, value):
+    """Test that other ISO 8601 shapes and out-of-range fields fail the default format."""
+    with pytest.raises(pytest.fail.Exception, match="does not match format"):
+        assert_helpers.assert_datetime_format(value)
+
+
+@pytest.mark.unit
+def test_assert_datetime_format_custom_fmt(assert_helpers):
+    """Test that a custom format is checked with strptime."""
+    assert_helpers.assert_datetime_format("01/02/2024", fmt="%d/%m/%Y")
+
+    with pytest.raises(pytest.fail.Exception, match="does not match format"):
+        assert_helpers.assert_datetime_format("2024-01-02", fmt="%d/%m/%Y")
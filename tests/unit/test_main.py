@@ -0,0 +1,96 @@
+"""
+Tests for the command-line entry point.
+
+Tests verify:
+- Subcommand detection skips global options and their values
+- --version exits without starting the server
+- A registered subcommand without a handler prints help and returns 1
+- uvloop/httptools are selected when available, else asyncio/h11 with a warning
+"""
+
+import logging
+
+import pytest
+
+from challenge import __main__ as cli
+from challenge.__main__ import _SUBCOMMANDS, _server_backends, _sniff_subcommand, main
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        ([], None),
+        (["--version"], None),
+        (["--help"], None),
+        (["api"], "api"),
+        (["api", "--port", "9000"], "api"),
+        (["--log-level", "DEBUG", "api"], "api"),
+        (["--log-level=DEBUG", "api"], "api"),
+        (["unknown"], "unknown"),
+    ],
+    ids=[
+        "empty",
+        "version",
+        "help",
+        "api",
+        "api-with-options",
+        "log-level-before-command",
+        "log-level-inline-value",
+        "unknown-command",
+    ],
+)
+def test_sniff_subcommand(argv, expected):
+    """Test that the first positional argument is detected as the subcommand."""
+    assert _sniff_subcommand(argv) == expected
+
+
+@pytest.mark.unit
+def test_version_exits_cleanly(capsys):
+    """Test that --version prints the version and exits with status 0."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
+
+    assert exc_info.value.code == 0
+    assert "skeleton-challenge" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_unknown_command_is_rejected():
+    """Test that an unknown subcommand is reported as an argument error."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["unknown"])
+
+    assert exc_info.value.code == 2
+
+
+@pytest.mark.unit
+def test_unhandled_command_prints_help(monkeypatch, capsys):
+    """Test that a subcommand with no handler prints help and returns 1."""
+    monkeypatch.setitem(_SUBCOMMANDS, "noop", lambda subparsers: subparsers.add_parser("noop"))
+
+    assert main(["noop"]) == 1
+    assert "usage:" in capsys.readouterr().out
+
+
+@pytest.mark.unit
+def test_server_backends_prefers_uvloop_and_httptools(monkeypatch, caplog):
+    """Test that uvloop/httptools are selected without a warning when importable."""
+    monkeypatch.setattr(cli, "find_spec", lambda name: object())
+
+    with caplog.at_level(logging.WARNING, logger="challenge.__main__"):
+        assert _server_backends() == ("uvloop", "httptools")
+
+    assert not caplog.records
+
+
+@pytest.mark.unit
+def test_server_backends_falls_back_with_warning(monkeypatch, caplog):
+    """Test that missing uvloop/httptools fall back to asyncio/h11 and log a warning."""
+    monkeypatch.setattr(cli, "find_spec", lambda name: None)
+
+    with caplog.at_level(logging.WARNING, logger="challenge.__main__"):
+        assert _server_backends() == ("asyncio", "h11")
+
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
+    assert "falling back to asyncio/h11" in caplog.records[0].getMessage()
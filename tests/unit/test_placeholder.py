@@ -4,6 +4,8 @@ Placeholder test to verify test infrastructure works.
 This file can be deleted once real tests are added.
 """
 
+from importlib.metadata import PackageNotFoundError, version
+
 import pytest
 
 import challenge
@@ -14,11 +16,21 @@ def test_placeholder():
     assert True
 
 
-def test_imports():
-    """Verify package can be imported."""
+def test_package_importable():
+    """Verify package can be imported and reports the expected version."""
     assert challenge.__version__ == "0.1.0"
 
 
+def test_installed_version_matches_package():
+    """Verify the installed distribution version matches ``challenge.__version__``."""
+    try:
+        installed = version("skeleton-challenge")
+    except PackageNotFoundError:
+        pytest.skip("skeleton-challenge is not installed (run via uv/tox)")
+
+    assert installed == challenge.__version__
+
+
 @pytest.mark.parametrize(
     ("value", "expected"),
     [
@@ -26,6 +38,7 @@ def test_imports():
         ("test", "test"),
         ([1, 2, 3], [1, 2, 3]),
     ],
+    ids=["int", "str", "list"],
 )
 def test_parameterized_example(value, expected):
     """Example of parameterized test."""
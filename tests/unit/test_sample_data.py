@@ -0,0 +1,39 @@
+"""
+Tests for the shared sample data fixtures in conftest.
+
+Tests verify:
+- Read-only fixtures reject mutation
+- Mutable copies are plain, JSON-serializable dicts independent of the shared data
+"""
+
+import json
+
+import pytest
+
+
+@pytest.mark.unit
+def test_sample_entity_data_is_read_only(sample_entity_data):
+    """Test that the shared entity data and its nested metadata cannot be mutated."""
+    with pytest.raises(TypeError):
+        sample_entity_data["name"] = "changed"
+    with pytest.raises(TypeError):
+        sample_entity_data["metadata"]["author"] = "changed"
+
+
+@pytest.mark.unit
+def test_mutable_sample_entity_data_is_json_serializable(mutable_sample_entity_data):
+    """Test that the mutable copy is a deep plain dict usable as a JSON body."""
+    assert type(mutable_sample_entity_data["metadata"]) is dict
+    assert json.loads(json.dumps(mutable_sample_entity_data)) == mutable_sample_entity_data
+
+
+@pytest.mark.unit
+def test_mutable_copies_do_not_touch_shared_data(
+    sample_config, mutable_sample_config, sample_entity_data, mutable_sample_entity_data
+):
+    """Test that mutating the copies leaves the session-scoped data unchanged."""
+    mutable_sample_config["log_level"] = "ERROR"
+    mutable_sample_entity_data["metadata"]["author"] = "changed"
+
+    assert sample_config["log_level"] == "DEBUG"
+    assert sample_entity_data["metadata"]["author"] == "test"